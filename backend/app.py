@@ -2,20 +2,35 @@ from db import init_db
 from auth_local import create_user, login_user
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 
+import asyncio
+import hashlib
+import heapq
+import json
 import numpy as np
 import re
-import networkx as nx
+import zlib
+from collections import Counter, OrderedDict
+from itertools import combinations
+from operator import itemgetter
 
-from ig_tools import profile_basic, profile_audit, follower_audit
+from ig_tools import profile_basic, profile_audit, follower_audit, close_browser
 
 app = FastAPI(title="InsightPro Backend")
 
 init_db()
 
-HASHTAG_RE = re.compile(r"#([A-Za-z0-9_]+)")
+
+@app.on_event("shutdown")
+async def shutdown_browser():
+    await close_browser()
+
+HASHTAG_RE = re.compile(r"#([a-z0-9_]+)", re.IGNORECASE)
+IG_URL_RE = re.compile(r"instagram\.com/([A-Za-z0-9._]+)/?")
 
 
 # -------------------------
@@ -63,9 +78,10 @@ class LoginRequest(BaseModel):
 # -------------------------
 def normalize_username(s: str) -> str:
     s = s.strip()
-    m = re.search(r"instagram\.com/([A-Za-z0-9._]+)/?", s)
-    if m:
-        return m.group(1)
+    if "instagram.com" in s:
+        m = IG_URL_RE.search(s)
+        if m:
+            return m.group(1)
     if s.startswith("@"):
         s = s[1:]
     return s
@@ -74,6 +90,66 @@ def normalize_username(s: str) -> str:
 # -------------------------
 # Math: Discrete probability
 # -------------------------
+# Likelihood lookup tables, one row of (mu, sigma, reason) per bucket.
+# Bucket edges feed np.searchsorted so each signal picks its row without
+# an if/elif chain, and all three Gaussians go through one fused np.exp.
+ER_EDGES = np.array([0.005, 0.02, 0.06])
+ER_MUS = np.array([35.0, 60.0, 75.0, 65.0])
+ER_SIGMAS = np.array([18.0, 15.0, 12.0, 20.0])
+ER_REASONS = [
+    "Very low engagement rate → possible fake/low-quality followers.",
+    "Moderate-low engagement rate.",
+    "Healthy engagement rate.",
+    "Very high engagement rate → could be viral/small-account effect (uncertainty).",
+]
+
+RATIO_EDGES = np.array([0.5, 2.0])
+RATIO_MUS = np.array([55.0, 65.0, 70.0])
+RATIO_SIGMAS = np.array([18.0, 14.0, 14.0])
+RATIO_REASONS = [
+    "Followers lower than following → early-stage or follow-back behavior.",
+    "Balanced follower/following ratio.",
+    "High follower/following ratio.",
+]
+
+POSTS_EDGES = np.array([10, 50])
+POSTS_MUS = np.array([55.0, 65.0, 70.0])
+POSTS_SIGMAS = np.array([20.0, 16.0, 14.0])
+POSTS_REASONS = [
+    "Few posts → higher uncertainty.",
+    "Moderate number of posts.",
+    "Many posts → more stable estimate.",
+]
+
+# Authenticity grid X in 0..100, shared by every call.
+XS = np.arange(0, 101, dtype=np.float64)
+XS_COL = XS[:, None]
+
+
+@lru_cache(maxsize=64)
+def _posterior_moments(i1: int, i2: int, i3: int) -> Tuple[float, float]:
+    """E[X] and Var(X) of the product of three Gaussians on the 0..100 grid.
+
+    The moments are a pure function of the three bucket indices — at most
+    4·3·3 = 36 combinations — so the cache makes steady-state calls a dict
+    lookup. The kernel itself stays small: the problem is tiny (303 points)
+    and NumPy dispatch overhead dominates real FLOPs, so it's one fused
+    z-square, one exp, two dots.
+    """
+    mus = np.array([ER_MUS[i1], RATIO_MUS[i2], POSTS_MUS[i3]])
+    sigmas = np.array([ER_SIGMAS[i1], RATIO_SIGMAS[i2], POSTS_SIGMAS[i3]])
+
+    # Sum the log-likelihoods first, then exponentiate once (stable + one exp).
+    z = (XS_COL - mus) / sigmas
+    logp = -0.5 * (z * z).sum(axis=1)
+    posterior = np.exp(logp - logp.max())
+    posterior /= posterior.sum()
+
+    EX = float(np.dot(XS, posterior))
+    VarX = float(np.dot((XS - EX) ** 2, posterior))
+    return EX, VarX
+
+
 def authenticity_estimate(data: Dict[str, Any]) -> Dict[str, Any]:
     followers = max(int(data.get("followers") or 0), 1)
     following = max(int(data.get("following") or 0), 1)
@@ -81,55 +157,18 @@ def authenticity_estimate(data: Dict[str, Any]) -> Dict[str, Any]:
     avg_likes = max(int(data.get("avg_likes") or 0), 0)
     avg_comments = max(int(data.get("avg_comments") or 0), 0)
 
-    xs = np.arange(0, 101)
-
     er = (avg_likes + 3 * avg_comments) / followers
-
-    if er < 0.005:
-        mu, sigma = 35, 18
-        reason = "Very low engagement rate → possible fake/low-quality followers."
-    elif er < 0.02:
-        mu, sigma = 60, 15
-        reason = "Moderate-low engagement rate."
-    elif er < 0.06:
-        mu, sigma = 75, 12
-        reason = "Healthy engagement rate."
-    else:
-        mu, sigma = 65, 20
-        reason = "Very high engagement rate → could be viral/small-account effect (uncertainty)."
-
-    L1 = np.exp(-0.5 * ((xs - mu) / sigma) ** 2) + 1e-12
-
     ratio = followers / following
-    if ratio < 0.5:
-        mu2, sigma2 = 55, 18
-        reason2 = "Followers lower than following → early-stage or follow-back behavior."
-    elif ratio < 2:
-        mu2, sigma2 = 65, 14
-        reason2 = "Balanced follower/following ratio."
-    else:
-        mu2, sigma2 = 70, 14
-        reason2 = "High follower/following ratio."
-
-    L2 = np.exp(-0.5 * ((xs - mu2) / sigma2) ** 2) + 1e-12
-
-    if posts < 10:
-        mu3, sigma3 = 55, 20
-        reason3 = "Few posts → higher uncertainty."
-    elif posts < 50:
-        mu3, sigma3 = 65, 16
-        reason3 = "Moderate number of posts."
-    else:
-        mu3, sigma3 = 70, 14
-        reason3 = "Many posts → more stable estimate."
 
-    L3 = np.exp(-0.5 * ((xs - mu3) / sigma3) ** 2) + 1e-12
+    i1 = int(np.searchsorted(ER_EDGES, er, side="right"))
+    i2 = int(np.searchsorted(RATIO_EDGES, ratio, side="right"))
+    i3 = int(np.searchsorted(POSTS_EDGES, posts, side="right"))
 
-    posterior = (L1 * L2 * L3)
-    posterior = posterior / posterior.sum()
+    reason = ER_REASONS[i1]
+    reason2 = RATIO_REASONS[i2]
+    reason3 = POSTS_REASONS[i3]
 
-    EX = float(np.sum(xs * posterior))
-    VarX = float(np.sum((xs - EX) ** 2 * posterior))
+    EX, VarX = _posterior_moments(i1, i2, i3)
 
     fake_pct = float(max(0.0, min(100.0, 100.0 - EX)))
     real_pct = 100.0 - fake_pct
@@ -141,11 +180,15 @@ def authenticity_estimate(data: Dict[str, Any]) -> Dict[str, Any]:
     else:
         confidence = "Low"
 
+    fake_pct, real_pct, EX, VarX = np.round(
+        np.array([fake_pct, real_pct, EX, VarX]), 2
+    ).tolist()
+
     return {
-        "fake_pct": round(fake_pct, 2),
-        "real_pct": round(real_pct, 2),
-        "expected_authenticity": round(EX, 2),
-        "variance_authenticity": round(VarX, 2),
+        "fake_pct": fake_pct,
+        "real_pct": real_pct,
+        "expected_authenticity": EX,
+        "variance_authenticity": VarX,
         "confidence": confidence,
         "reasons": [reason, reason2, reason3],
     }
@@ -158,24 +201,40 @@ def hashtag_graph_stats(captions: Optional[List[str]]) -> Dict[str, Any]:
     if not captions:
         return {"nodes": 0, "edges": 0, "top_hashtags": []}
 
-    G = nx.Graph()
-    for cap in captions:
-        tags = [t.lower() for t in HASHTAG_RE.findall(cap or "")]
-        tags = list(dict.fromkeys(tags))
-        for t in tags:
-            G.add_node(t)
-        for i in range(len(tags)):
-            for j in range(i + 1, len(tags)):
-                a, b = tags[i], tags[j]
-                if G.has_edge(a, b):
-                    G[a][b]["weight"] += 1
-                else:
-                    G.add_edge(a, b, weight=1)
-
-    top = sorted(G.degree(), key=lambda x: x[1], reverse=True)[:10]
+    # Merge captions into one buffer: a single '#' check covers the whole
+    # batch, and one lowercase pass replaces per-tag .lower() calls. A NUL
+    # sentinel marks the caption boundaries — captions themselves contain
+    # newlines (hashtags often sit on their own trailing lines), and those
+    # must stay inside one caption for co-occurrence.
+    blob = "\x00".join(c or "" for c in captions)
+    if "#" not in blob:
+        return {"nodes": 0, "edges": 0, "top_hashtags": []}
+
+    # Plain Counters over (a, b) tuples — no graph object, no per-edge
+    # dict-of-dicts bookkeeping.
+    nodes = set()
+    edge_counts: Counter = Counter()
+    for cap in blob.lower().split("\x00"):
+        if "#" not in cap:
+            continue
+        # Order doesn't matter for co-occurrence, so a set beats the
+        # dict.fromkeys dance; edges are normalized to (min, max).
+        tags = {m.group(1) for m in HASHTAG_RE.finditer(cap)}
+        nodes.update(tags)
+        edge_counts.update(
+            (a, b) if a < b else (b, a) for a, b in combinations(tags, 2)
+        )
+
+    degree: Counter = Counter({t: 0 for t in nodes})
+    for a, b in edge_counts:
+        degree[a] += 1
+        degree[b] += 1
+
+    # Partial sort: O(n log 10) instead of sorting the whole vocabulary.
+    top = heapq.nlargest(10, degree.items(), key=itemgetter(1))
     top_list = [{"hashtag": h, "degree": int(d)} for h, d in top]
 
-    return {"nodes": G.number_of_nodes(), "edges": G.number_of_edges(), "top_hashtags": top_list}
+    return {"nodes": len(nodes), "edges": len(edge_counts), "top_hashtags": top_list}
 
 
 # -------------------------
@@ -200,42 +259,61 @@ KEYWORDS = {
     "education": ["learn", "study", "course", "lesson"],
 }
 
+# One alternation pattern over all keywords so the text is scanned once
+# (in C) instead of one str.count pass per keyword. The lookahead makes
+# the matches zero-width, so finditer reports overlapping occurrences
+# ("ai" inside "daily") exactly like the old per-keyword counts did.
+KW2TOPIC = {kw: topic for topic, kws in KEYWORDS.items() for kw in kws}
+KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(KW2TOPIC, key=len, reverse=True))) + "))"
+)
+
+TOPIC_INDEX = {t: i for i, t in enumerate(TOPICS)}
+KW2IDX = {kw: TOPIC_INDEX[t] for kw, t in KW2TOPIC.items()}
+
+# Fallback distribution for the no-text path, built once.
+LIFESTYLE_PROBS = np.zeros(len(TOPICS))
+LIFESTYLE_PROBS[TOPIC_INDEX["lifestyle"]] = 1.0
+LIFESTYLE_PROBS.setflags(write=False)
+
 
 def content_breakdown(bio: str, captions: Optional[List[str]]) -> Dict[str, Any]:
     text = (bio or "") + "\n" + "\n".join(captions or [])
     text_l = text.lower()
 
-    counts = {t: 0 for t in TOPICS}
-    for topic, kws in KEYWORDS.items():
-        for kw in kws:
-            counts[topic] += text_l.count(kw)
+    counts = np.zeros(len(TOPICS), dtype=np.int64)
+    for m in KEYWORD_RE.finditer(text_l):
+        counts[KW2IDX[m.group(1)]] += 1
 
-    total = sum(counts.values())
+    total = int(counts.sum())
     if total == 0:
-        probs = {t: 0.0 for t in TOPICS}
-        probs["lifestyle"] = 1.0
+        probs = LIFESTYLE_PROBS
         summary = "Not enough text to classify; defaulted to lifestyle."
     else:
-        probs = {t: counts[t] / total for t in TOPICS}
-        top3 = sorted(probs.items(), key=lambda x: x[1], reverse=True)[:3]
-        summary = f"Main topics: {top3[0][0]}, {top3[1][0]}, {top3[2][0]}."
+        probs = counts / total
+        # O(n) partial select of the top 3, then order just those.
+        top3_idx = np.argpartition(-probs, 3)[:3]
+        top3_idx = top3_idx[np.argsort(-probs[top3_idx])]
+        summary = f"Main topics: {TOPICS[top3_idx[0]]}, {TOPICS[top3_idx[1]]}, {TOPICS[top3_idx[2]]}."
 
-    topics_pct = {t: round(probs[t] * 100.0, 2) for t in TOPICS}
+    topics_pct = dict(zip(TOPICS, np.round(probs * 100.0, 2).tolist()))
     return {"topics": topics_pct, "summary": summary}
 
 
 # -------------------------
 # Auth endpoints
 # -------------------------
+# Password hashing + SQLite are blocking; run them in the threadpool so
+# they don't stall the event loop under concurrent requests.
 @app.post("/signup")
-def signup(req: SignupRequest):
-    create_user(req.email, req.password)
+async def signup(req: SignupRequest):
+    await run_in_threadpool(create_user, req.email, req.password)
     return {"ok": True}
 
 
 @app.post("/login")
-def login(req: LoginRequest):
-    user_id = login_user(req.email, req.password)
+async def login(req: LoginRequest):
+    user_id = await run_in_threadpool(login_user, req.email, req.password)
     return {"ok": True, "user_id": user_id}
 
 
@@ -271,32 +349,62 @@ async def ig_follower_audit(req: IgFollowerAuditRequest):
 # -------------------------
 # Advice rotation
 # -------------------------
+ADVICE_BUNDLES = (
+    ("Post 3–4x/week consistently.", "Reply to comments in first hour.", "Use fewer but relevant hashtags."),
+    ("Try Reels with a strong hook.", "Ask a question in caption.", "Collaborate with similar creators."),
+    ("Focus on your top 2 content pillars.", "Test two posting times.", "Double down on best format."),
+)
+
+
 def advice_rotation(username: str) -> List[str]:
-    bundles = [
-        ["Post 3–4x/week consistently.", "Reply to comments in first hour.", "Use fewer but relevant hashtags."],
-        ["Try Reels with a strong hook.", "Ask a question in caption.", "Collaborate with similar creators."],
-        ["Focus on your top 2 content pillars.", "Test two posting times.", "Double down on best format."],
-    ]
-    idx = sum(ord(c) for c in username) % len(bundles)
-    return bundles[idx]
+    # crc32 runs in C and is stable across processes, unlike hash().
+    idx = zlib.crc32(username.encode("utf-8")) % len(ADVICE_BUNDLES)
+    return list(ADVICE_BUNDLES[idx])
 
 
 # -------------------------
 # Predicted /analyze endpoint (math model)
 # -------------------------
+# /analyze is a pure function of its inputs, so identical requests
+# (dashboard refreshes, retries) can be answered from a small LRU.
+_ANALYZE_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_ANALYZE_CACHE_MAX = 512
+
+
 @app.post("/analyze")
-def analyze(req: AnalyzeRequest):
+async def analyze(req: AnalyzeRequest):
+    data = req.model_dump()
+    # Normalize the optional captions so None and [] hit the same entry.
+    data["recent_captions"] = data.get("recent_captions") or []
+
+    key = hashlib.blake2b(
+        json.dumps(data, sort_keys=True).encode(), digest_size=16
+    ).digest()
+    cached = _ANALYZE_CACHE.get(key)
+    if cached is not None:
+        _ANALYZE_CACHE.move_to_end(key)
+        return cached
+
     username = normalize_username(req.username_or_url)
 
-    auth = authenticity_estimate(req.model_dump())
-    content = content_breakdown(req.bio_text or "", req.recent_captions)
-    gstats = hashtag_graph_stats(req.recent_captions)
+    # The three analyses are independent and CPU-bound; overlap them in
+    # threads so a large caption payload doesn't serialize behind the rest.
+    auth, content, gstats = await asyncio.gather(
+        asyncio.to_thread(authenticity_estimate, data),
+        asyncio.to_thread(content_breakdown, req.bio_text or "", req.recent_captions),
+        asyncio.to_thread(hashtag_graph_stats, req.recent_captions),
+    )
     advice = advice_rotation(username)
 
-    return {
+    result = {
         "username": username,
         "authenticity": auth,
         "content": content,
         "graph": gstats,
         "advice": advice,
     }
+
+    _ANALYZE_CACHE[key] = result
+    if len(_ANALYZE_CACHE) > _ANALYZE_CACHE_MAX:
+        _ANALYZE_CACHE.popitem(last=False)
+    return result
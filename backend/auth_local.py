@@ -1,14 +1,52 @@
+import hashlib
+import hmac
+import os
+import time
+
 from passlib.context import CryptContext
 from fastapi import HTTPException
-from db import get_conn
+from db import get_conn, WRITE_LOCK
+
+# argon2id with OWASP-recommended parameters verifies much faster than
+# bcrypt's default 12 rounds. bcrypt stays as a legacy scheme so old
+# hashes still verify and get re-hashed on next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+    deprecated="auto",
+)
+
+# bcrypt verify costs ~100ms by design; repeated logins (retries, probes)
+# shouldn't pay it every time. Cache results keyed by (hash, HMAC(password)).
+# The per-process random HMAC key keeps the cache from acting as a
+# plaintext-password oracle, and keys die with the process.
+_VERIFY_KEY = os.urandom(32)
+_VERIFY_CACHE: dict = {}
+_VERIFY_CACHE_MAX = 1024
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Short-TTL negative cache: a wrong password retried within a few seconds
+# is rejected without re-running the KDF. Doubles as a light brute-force
+# throttle.
+_NEG: dict = {}
+_NEG_TTL = 5.0
+_NEG_GC_AGE = 60.0
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+    key = (password_hash, hmac.new(_VERIFY_KEY, password.encode(), "sha256").digest())
+    cached = _VERIFY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    ok = pwd_context.verify(password, password_hash)
+    if len(_VERIFY_CACHE) >= _VERIFY_CACHE_MAX:
+        _VERIFY_CACHE.clear()
+    _VERIFY_CACHE[key] = ok
+    return ok
 
 def create_user(email: str, password: str) -> None:
     email = email.strip().lower()
@@ -18,31 +56,50 @@ def create_user(email: str, password: str) -> None:
     conn = get_conn()
     cur = conn.cursor()
 
-    cur.execute("SELECT id FROM users WHERE email = ?", (email,))
-    if cur.fetchone():
-        conn.close()
+    # Single INSERT; the UNIQUE constraint on email replaces the
+    # lookup-then-insert round trip (and its race window).
+    with WRITE_LOCK:
+        cur.execute(
+            "INSERT INTO users (email, password_hash) VALUES (?, ?) "
+            "ON CONFLICT(email) DO NOTHING",
+            (email, hash_password(password))
+        )
+        conn.commit()
+    if cur.rowcount == 0:
         raise HTTPException(status_code=400, detail="Email already exists.")
 
-    cur.execute(
-        "INSERT INTO users (email, password_hash) VALUES (?, ?)",
-        (email, hash_password(password))
-    )
-    conn.commit()
-    conn.close()
-
 def login_user(email: str, password: str) -> int:
     email = email.strip().lower()
+
+    neg_key = hashlib.blake2b(
+        email.encode() + b"|" + password.encode(), digest_size=16
+    ).digest()
+    now = time.time()
+    if now - _NEG.get(neg_key, -_NEG_TTL) < _NEG_TTL:
+        raise HTTPException(status_code=401, detail="Invalid email or password.")
+
     conn = get_conn()
     cur = conn.cursor()
 
     cur.execute("SELECT id, password_hash FROM users WHERE email = ?", (email,))
     row = cur.fetchone()
-    conn.close()
 
     if not row:
         raise HTTPException(status_code=401, detail="Invalid email or password.")
 
     if not verify_password(password, row["password_hash"]):
+        _NEG[neg_key] = now
+        for k in [k for k, t in _NEG.items() if now - t > _NEG_GC_AGE]:
+            del _NEG[k]
         raise HTTPException(status_code=401, detail="Invalid email or password.")
 
+    # Transparently migrate legacy (bcrypt) hashes to argon2.
+    if pwd_context.needs_update(row["password_hash"]):
+        with WRITE_LOCK:
+            cur.execute(
+                "UPDATE users SET password_hash = ? WHERE id = ?",
+                (hash_password(password), row["id"])
+            )
+            conn.commit()
+
     return int(row["id"])
@@ -1,11 +1,11 @@
 import streamlit as st
+import gzip
+import io
 import json
 import os
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import numpy as np
+import re
+from collections import Counter
+from itertools import chain
 
 st.set_page_config(page_title="Stats Dashboard", layout="wide")
 
@@ -65,6 +65,31 @@ GENRE_HASHTAGS = {
                  "relax", "spa", "beauty", "skincare", "selfcaresunday", "healing", "peace", "gratitude"]
 }
 
+# Keyword -> genres map plus one combined pattern (longest keyword first),
+# so each hashtag is scanned once instead of against every genre's list.
+KW_TO_GENRES = {}
+for _genre, _kws in GENRE_HASHTAGS.items():
+    for _kw in _kws:
+        KW_TO_GENRES.setdefault(_kw, []).append(_genre)
+
+# A matched keyword must also credit every shorter keyword nested inside
+# it ("healthylifestyle" contains "health", "life", "lifestyle", "style"),
+# or genres scored by the per-genre substring test get dropped. Fold the
+# nested keywords' genres in once so each match resolves to its full set.
+KW_GENRES = {}
+for _kw, _genres in KW_TO_GENRES.items():
+    _closed = set(_genres)
+    for _other, _other_genres in KW_TO_GENRES.items():
+        if _other != _kw and _other in _kw:
+            _closed.update(_other_genres)
+    KW_GENRES[_kw] = frozenset(_closed)
+
+# Lookahead alternation: zero-width matches make finditer try every
+# position, so overlapping keywords ("art" inside "startup") all surface.
+GENRE_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(KW_TO_GENRES, key=len, reverse=True)) + "))"
+)
+
 def classify_genre(posts):
     """
     Classify account genre based on hashtags from posts
@@ -74,40 +99,72 @@ def classify_genre(posts):
         return {"top_genre": "Unknown", "scores": {}, "confidence": 0}
     
     # Collect all hashtags (lowercase for matching)
-    all_hashtags = []
-    for post in posts:
-        hashtags = [tag.lower() for tag in post.get('hashtags', [])]
-        all_hashtags.extend(hashtags)
+    all_hashtags = [
+        tag.lower() for tag in chain.from_iterable(p.get('hashtags') or () for p in posts)
+    ]
     
     if not all_hashtags:
         return {"top_genre": "Unknown", "scores": {}, "confidence": 0}
     
-    # Count matches for each genre
-    genre_scores = {}
-    for genre, keywords in GENRE_HASHTAGS.items():
-        score = sum(1 for tag in all_hashtags if any(kw in tag for kw in keywords))
-        genre_scores[genre] = score
-    
-    # Find top genre
-    if not any(genre_scores.values()):
-        return {"top_genre": "Unknown", "scores": genre_scores, "confidence": 0}
-    
-    top_genre = max(genre_scores.items(), key=lambda x: x[1])
-    total_matches = sum(genre_scores.values())
+    # Count matches for each genre: one regex sweep per hashtag finds every
+    # matching keyword, and each matched genre gets at most +1 per tag.
+    genre_scores = Counter()
+    for tag in all_hashtags:
+        # Most tags equal a keyword outright (#fashion, #workout): a dict
+        # hit settles those without touching the regex scan. The closed
+        # map already carries the nested keywords' genres, so both paths
+        # score exactly like the substring test over every genre's list.
+        exact = KW_GENRES.get(tag)
+        if exact is not None:
+            genre_scores.update(exact)
+            continue
+        genre_scores.update(
+            {g for m in GENRE_KEYWORD_RE.finditer(tag) for g in KW_GENRES[m.group(1)]}
+        )
+
+    # Find top genre — most_common gives the sorted top-3 and the winner
+    # in one partial sort instead of separate max/sorted passes.
+    if not genre_scores:
+        return {"top_genre": "Unknown", "scores": dict(genre_scores), "confidence": 0}
+
+    sorted_genres = genre_scores.most_common(3)
+    top_genre = sorted_genres[0]
+    total_matches = genre_scores.total()
     confidence = (top_genre[1] / total_matches * 100) if total_matches > 0 else 0
-    
-    # Get top 3 genres
-    sorted_genres = sorted(genre_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-    
+
     return {
         "top_genre": top_genre[0],
         "top_genres": sorted_genres,
-        "scores": genre_scores,
+        "scores": dict(genre_scores),
         "confidence": round(confidence, 1),
         "total_hashtags": len(all_hashtags),
         "total_matches": total_matches
     }
 
+@st.cache_data
+def load_audit(path, mtime):
+    """Parse an audit JSON once per (path, mtime); reruns hit the cache."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt') as f:
+        return json.load(f)
+
+
+@st.cache_data(ttl=5)
+def list_audits(data_dir):
+    """Partition audit files in one scandir pass; short TTL picks up new scans."""
+    profile, follower = [], []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("profile_audit_"):
+                profile.append(name)
+            elif name.startswith("follower_audit_"):
+                follower.append(name)
+    profile.sort(reverse=True)
+    follower.sort(reverse=True)
+    return profile, follower
+
+
 st.title("📊 Analytics Dashboard")
 
 # Check if data directory exists
@@ -116,45 +173,159 @@ if not os.path.exists(DATA_DIR):
     st.stop()
 
 # Get all JSON files
-profile_files = sorted([f for f in os.listdir(DATA_DIR) if f.startswith("profile_audit_")], reverse=True)
-follower_files = sorted([f for f in os.listdir(DATA_DIR) if f.startswith("follower_audit_")], reverse=True)
+profile_files, follower_files = list_audits(DATA_DIR)
 
 if not profile_files and not follower_files:
     st.warning("No saved data found. Run Profile Audit or Follower Audit first!")
     st.stop()
 
+# Heavy imports only after the empty-data gates: a dataless page stops
+# above without paying the pandas/plotly import cost.
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+
+# Derived posts frame cached on (path, mtime) — the key the hasher sees is
+# two scalars, never the list of post dicts, and reruns reuse the frame.
+@st.cache_data
+def build_posts_df(path, mtime):
+    posts = load_audit(path, mtime).get('posts', [])
+    n = len(posts)
+    # Column-oriented build: one fromiter pass per numeric column and a
+    # vectorized engagement sum, instead of a dict allocation per post.
+    likes = np.fromiter((p.get('likes', 0) for p in posts), dtype=np.int64, count=n)
+    comments = np.fromiter((p.get('comments_count', 0) for p in posts), dtype=np.int64, count=n)
+    return pd.DataFrame.from_dict({
+        'shortcode': [p.get('shortcode') for p in posts],
+        'date': [p.get('date') for p in posts],
+        'likes': likes,
+        'comments': comments,
+        'engagement': likes + comments,
+        'type': [p.get('type', 'post') for p in posts],
+        'hashtags_count': np.fromiter(
+            (len(p.get('hashtags', ())) for p in posts), dtype=np.int32, count=n
+        ),
+    })
+
+
+# Figure builders cached on scalar/tuple keys: reruns and tab switches
+# reuse the constructed figure instead of paying plotly's build cost.
+@st.cache_data
+def make_engagement_fig(path, mtime):
+    df = build_posts_df(path, mtime)
+    return px.line(
+        df,
+        x=df.index,
+        y=['likes', 'comments'],
+        title="Likes & Comments per Post",
+        labels={'value': 'Count', 'variable': 'Metric', 'index': 'Post #'}
+    )
+
+
+@st.cache_data
+def make_hashtags_fig(path, mtime):
+    df = build_posts_df(path, mtime)
+    return px.bar(
+        df,
+        y='hashtags_count',
+        title="Hashtags per Post",
+        labels={'hashtags_count': 'Number of Hashtags', 'index': 'Post #'}
+    )
+
+
+@st.cache_data
+def make_types_fig(names, values):
+    return px.pie(values=list(values), names=list(names), title="Post Types")
+
+
+@st.cache_data
+def make_hashtag_freq_fig(top_tags):
+    return px.bar(
+        x=[count for _, count in top_tags],
+        y=[tag for tag, _ in top_tags],
+        orientation='h',
+        title="Top 15 Hashtags",
+        labels={'x': 'Frequency', 'y': 'Hashtag'}
+    )
+
+
+@st.cache_data
+def make_reasons_fig(reason_items):
+    reasons_df = pd.DataFrame(sorted(reason_items, key=lambda kv: kv[1], reverse=True),
+                              columns=['Reason', 'Count'])
+    return px.bar(
+        reasons_df,
+        x='Count',
+        y='Reason',
+        orientation='h',
+        title="Most Common Bot Indicators"
+    )
+
 # Sidebar - File selection
 st.sidebar.header("Select Data")
 
 selected_profile = None
 selected_follower = None
+profile_key = None
+follower_key = None
 
 if profile_files:
     st.sidebar.subheader("Profile Audits")
     profile_choice = st.sidebar.selectbox(
         "Select profile scan",
         profile_files,
-        format_func=lambda x: x.replace("profile_audit_", "").replace(".json", "")
+        format_func=lambda x: x.replace("profile_audit_", "").replace(".json.gz", "").replace(".json", "")
     )
     if profile_choice:
-        with open(os.path.join(DATA_DIR, profile_choice), 'r') as f:
-            selected_profile = json.load(f)
+        profile_path = os.path.join(DATA_DIR, profile_choice)
+        profile_mtime = os.path.getmtime(profile_path)
+        profile_key = (profile_path, profile_mtime)
+        selected_profile = load_audit(profile_path, profile_mtime)
 
 if follower_files:
     st.sidebar.subheader("Follower Audits")
     follower_choice = st.sidebar.selectbox(
         "Select follower scan",
         follower_files,
-        format_func=lambda x: x.replace("follower_audit_", "").replace(".json", "")
+        format_func=lambda x: x.replace("follower_audit_", "").replace(".json.gz", "").replace(".json", "")
     )
     if follower_choice:
-        with open(os.path.join(DATA_DIR, follower_choice), 'r') as f:
-            selected_follower = json.load(f)
+        follower_path = os.path.join(DATA_DIR, follower_choice)
+        follower_mtime = os.path.getmtime(follower_path)
+        follower_key = (follower_path, follower_mtime)
+        selected_follower = load_audit(follower_path, follower_mtime)
 
 
 # ===========================
 # AUTHENTICITY SCORE CALCULATOR
 # ===========================
+# Tier tables for the percentage-based factors: first (threshold,
+# deduction, reason) entry the value exceeds wins, highest tier first.
+GENERIC_TIERS = (
+    (50, 15, "Very high generic comments ({}%)"),
+    (30, 8, "High generic comments ({}%)"),
+)
+DUP_TIERS = (
+    (25, 15, "High duplicate comments ({}%)"),
+    (15, 8, "Moderate duplicate comments ({}%)"),
+)
+BOT_TIERS = (
+    (40, 25, "Very high bot-like followers ({}%)"),
+    (25, 15, "High bot-like followers ({}%)"),
+    (15, 8, "Moderate bot-like followers ({}%)"),
+)
+
+
+def _tier_deduction(value, tiers, reasons):
+    for threshold, deduction, reason in tiers:
+        if value > threshold:
+            reasons.append(reason.format(value))
+            return deduction
+    return 0
+
+
 def calculate_authenticity_score(profile_data, follower_data=None):
     """
     Calculate a comprehensive authenticity score (0-100)
@@ -162,46 +333,27 @@ def calculate_authenticity_score(profile_data, follower_data=None):
     """
     score = 100.0
     reasons = []
-    
+
     if profile_data:
         metrics = profile_data.get("metrics", {})
         followers = profile_data.get("followers", 0)
         following = profile_data.get("following", 0)
         posts_count = profile_data.get("posts_count", 0)
-        
-        # Factor 1: Engagement Rate
+
+        # Factor 1: Engagement Rate (floor depends on follower band)
         er_avg = metrics.get("er_avg", 0)
-        if followers < 10_000:
-            if er_avg < 1.0:
-                score -= 20
-                reasons.append("Low engagement rate for account size")
-        elif followers < 100_000:
-            if er_avg < 0.7:
-                score -= 20
-                reasons.append("Low engagement rate for account size")
-        else:
-            if er_avg < 0.3:
-                score -= 20
-                reasons.append("Low engagement rate for large account")
-        
-        # Factor 2: Generic Comments
-        generic_pct = metrics.get("generic_comments_pct", 0)
-        if generic_pct > 50:
-            score -= 15
-            reasons.append(f"Very high generic comments ({generic_pct}%)")
-        elif generic_pct > 30:
-            score -= 8
-            reasons.append(f"High generic comments ({generic_pct}%)")
-        
-        # Factor 3: Duplicate Comments
-        dup_pct = metrics.get("duplicate_comments_pct", 0)
-        if dup_pct > 25:
-            score -= 15
-            reasons.append(f"High duplicate comments ({dup_pct}%)")
-        elif dup_pct > 15:
-            score -= 8
-            reasons.append(f"Moderate duplicate comments ({dup_pct}%)")
-        
+        er_floor = 1.0 if followers < 10_000 else 0.7 if followers < 100_000 else 0.3
+        if er_avg < er_floor:
+            score -= 20
+            reasons.append(
+                "Low engagement rate for large account" if followers >= 100_000
+                else "Low engagement rate for account size"
+            )
+
+        # Factors 2-3: Generic / Duplicate Comments
+        score -= _tier_deduction(metrics.get("generic_comments_pct", 0), GENERIC_TIERS, reasons)
+        score -= _tier_deduction(metrics.get("duplicate_comments_pct", 0), DUP_TIERS, reasons)
+
         # Factor 4: Follower/Following Ratio
         if following > 0:
             ratio = followers / following
@@ -211,29 +363,20 @@ def calculate_authenticity_score(profile_data, follower_data=None):
             elif ratio < 0.8:
                 score -= 5
                 reasons.append("Following more than followers")
-        
+
         # Factor 5: Post Consistency (CV)
         like_cv = metrics.get("like_cv", 0)
         if like_cv < 0.15 and len(profile_data.get("posts", [])) >= 10:
             score -= 10
             reasons.append("Suspiciously consistent like counts")
-        
+
         # Factor 6: Risk Score from backend
         risk_score = metrics.get("risk_score", 0)
         score -= (risk_score * 0.3)  # Use 30% of backend risk score
-    
+
     if follower_data:
-        bot_pct = follower_data.get("likely_bot_like_pct", 0)
-        if bot_pct > 40:
-            score -= 25
-            reasons.append(f"Very high bot-like followers ({bot_pct}%)")
-        elif bot_pct > 25:
-            score -= 15
-            reasons.append(f"High bot-like followers ({bot_pct}%)")
-        elif bot_pct > 15:
-            score -= 8
-            reasons.append(f"Moderate bot-like followers ({bot_pct}%)")
-    
+        score -= _tier_deduction(follower_data.get("likely_bot_like_pct", 0), BOT_TIERS, reasons)
+
     score = max(0, min(100, score))
     
     if score >= 80:
@@ -258,12 +401,21 @@ def calculate_authenticity_score(profile_data, follower_data=None):
     }
 
 
+# Scored once per (profile, follower) file pair; every other rerun is a
+# cache hit keyed on two small tuples.
+@st.cache_data
+def combined_auth(profile_key, follower_key):
+    profile = load_audit(*profile_key) if profile_key else None
+    follower = load_audit(*follower_key) if follower_key else None
+    return calculate_authenticity_score(profile, follower)
+
+
 # ===========================
 # MAIN DASHBOARD
 # ===========================
 
 # Calculate Authenticity Score
-auth_result = calculate_authenticity_score(selected_profile, selected_follower)
+auth_result = combined_auth(profile_key, follower_key)
 
 # Calculate Genre Classification
 genre_result = None
@@ -314,29 +466,36 @@ with col4:
             delta=f"{genre_result['confidence']}% confidence"
         )
 
-# Gauge Chart for Authenticity
-fig_gauge = go.Figure(go.Indicator(
-    mode="gauge+number",
-    value=auth_result['score'],
-    title={'text': "Authenticity Score"},
-    gauge={
-        'axis': {'range': [0, 100]},
-        'bar': {'color': auth_result['color']},
-        'steps': [
-            {'range': [0, 40], 'color': "lightcoral"},
-            {'range': [40, 60], 'color': "lightyellow"},
-            {'range': [60, 80], 'color': "lightblue"},
-            {'range': [80, 100], 'color': "lightgreen"}
-        ],
-        'threshold': {
-            'line': {'color': "red", 'width': 4},
-            'thickness': 0.75,
-            'value': 50
+# Gauge Chart for Authenticity — cached per (score, color) so reruns skip
+# rebuilding and re-serializing the figure spec; uirevision lets Plotly.js
+# reuse the rendered gauge instead of redrawing it.
+@st.cache_data
+def build_gauge(score, color):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        title={'text': "Authenticity Score"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': color},
+            'steps': [
+                {'range': [0, 40], 'color': "lightcoral"},
+                {'range': [40, 60], 'color': "lightyellow"},
+                {'range': [60, 80], 'color': "lightblue"},
+                {'range': [80, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 50
+            }
         }
-    }
-))
-fig_gauge.update_layout(height=300)
-st.plotly_chart(fig_gauge, use_container_width=True)
+    ))
+    fig.update_layout(height=300, uirevision="gauge")
+    return fig
+
+
+st.plotly_chart(build_gauge(auth_result['score'], auth_result['color']), use_container_width=True)
 
 # Risk Factors
 if auth_result['reasons']:
@@ -390,156 +549,130 @@ if genre_result and genre_result['top_genre'] != "Unknown":
 st.divider()
 
 # ===========================
-# PROFILE ANALYSIS
-# ===========================
-if selected_profile:
-    st.header(f"📱 Profile: @{selected_profile['username']}")
-    
-    # Profile Overview
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Followers", f"{selected_profile.get('followers', 0):,}")
-    col2.metric("Following", f"{selected_profile.get('following', 0):,}")
-    col3.metric("Posts", f"{selected_profile.get('posts_count', 0):,}")
-    
-    ratio = selected_profile.get('followers', 1) / max(selected_profile.get('following', 1), 1)
-    col4.metric("Follower Ratio", f"{ratio:.2f}x")
-    
-    # Engagement Metrics
-    st.subheader("📊 Engagement Metrics")
-    metrics = selected_profile.get('metrics', {})
-    
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Avg ER", f"{metrics.get('er_avg', 0)}%")
-    col2.metric("Median ER", f"{metrics.get('er_median', 0)}%")
-    col3.metric("Avg Likes", f"{metrics.get('avg_likes', 0):,.0f}")
-    col4.metric("Avg Comments", f"{metrics.get('avg_comments', 0):,.0f}")
-    
-    # Comment Quality
-    st.subheader("💬 Comment Quality Analysis")
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Generic Comments", f"{metrics.get('generic_comments_pct', 0)}%")
-    col2.metric("Duplicate Comments", f"{metrics.get('duplicate_comments_pct', 0)}%")
-    col3.metric("Repeat Commenters", f"{metrics.get('repeat_commenters_pct', 0)}%")
-    
-    # Posts Analysis
-    posts = selected_profile.get('posts', [])
-    if posts:
-        st.subheader("📸 Posts Performance")
-        
-        # Create dataframe
-        posts_df = pd.DataFrame([{
-            'shortcode': p.get('shortcode'),
-            'date': p.get('date'),
-            'likes': p.get('likes', 0),
-            'comments': p.get('comments_count', 0),
-            'engagement': p.get('likes', 0) + p.get('comments_count', 0),
-            'type': p.get('type', 'post'),
-            'hashtags_count': len(p.get('hashtags', []))
-        } for p in posts])
-        
-        # Engagement over time
-        fig_engagement = px.line(
-            posts_df,
-            x=posts_df.index,
-            y=['likes', 'comments'],
-            title="Likes & Comments per Post",
-            labels={'value': 'Count', 'variable': 'Metric', 'index': 'Post #'}
-        )
-        st.plotly_chart(fig_engagement, use_container_width=True)
-        
-        # Post type distribution
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            type_counts = posts_df['type'].value_counts()
-            fig_types = px.pie(
-                values=type_counts.values,
-                names=type_counts.index,
-                title="Post Types"
-            )
-            st.plotly_chart(fig_types, use_container_width=True)
-        
-        with col2:
-            # Hashtags usage
-            fig_hashtags = px.bar(
-                posts_df,
-                y='hashtags_count',
-                title="Hashtags per Post",
-                labels={'hashtags_count': 'Number of Hashtags', 'index': 'Post #'}
-            )
-            st.plotly_chart(fig_hashtags, use_container_width=True)
-        
-        # Top performing posts
-        st.subheader("🏆 Top Performing Posts")
-        top_posts = posts_df.nlargest(5, 'engagement')[['shortcode', 'likes', 'comments', 'engagement', 'type']]
-        st.dataframe(top_posts, use_container_width=True)
-        
-        # All hashtags frequency
-        all_hashtags = []
-        for p in posts:
-            all_hashtags.extend(p.get('hashtags', []))
-        
-        if all_hashtags:
-            st.subheader("🏷️ Most Used Hashtags")
-            hashtag_counts = pd.Series(all_hashtags).value_counts().head(15)
-            fig_hashtag_freq = px.bar(
-                x=hashtag_counts.values,
-                y=hashtag_counts.index,
-                orientation='h',
-                title="Top 15 Hashtags",
-                labels={'x': 'Frequency', 'y': 'Hashtag'}
-            )
-            st.plotly_chart(fig_hashtag_freq, use_container_width=True)
-
-st.divider()
-
-# ===========================
-# FOLLOWER ANALYSIS
+# PROFILE / FOLLOWER ANALYSIS
 # ===========================
-if selected_follower:
-    st.header(f"👥 Follower Analysis: @{selected_follower['target_username']}")
-    
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Sample Size", f"{selected_follower.get('sample_size_collected', 0)}")
-    col2.metric("Bot-like %", f"{selected_follower.get('likely_bot_like_pct', 0)}%")
-    col3.metric("Authentic %", f"{100 - selected_follower.get('likely_bot_like_pct', 0)}%")
-    
-    # Bot reasons
-    reason_counts = selected_follower.get('reason_counts', {})
-    if reason_counts:
-        st.subheader("🚩 Bot Indicators")
-        
-        reasons_df = pd.DataFrame([
-            {'Reason': k, 'Count': v} for k, v in reason_counts.items()
-        ]).sort_values('Count', ascending=False)
-        
-        fig_reasons = px.bar(
-            reasons_df,
-            x='Count',
-            y='Reason',
-            orientation='h',
-            title="Most Common Bot Indicators"
-        )
-        st.plotly_chart(fig_reasons, use_container_width=True)
-    
-    # Follower sample preview
-    followers_sample = selected_follower.get('followers_sample_preview', [])
-    if followers_sample:
-        st.subheader("👤 Sample Followers")
-        
-        sample_df = pd.DataFrame(followers_sample)
-        
-        # Add color coding
-        def color_fake(row):
-            if row['likely_fake']:
-                return ['background-color: #ffcccc'] * len(row)
+# Tabs keep whichever section is off-screen from dominating the page;
+# with the cached loaders and frames above, tab switches redraw from cache.
+profile_tab, follower_tab = st.tabs(["📱 Profile", "👥 Followers"])
+
+with profile_tab:
+    if selected_profile:
+        st.header(f"📱 Profile: @{selected_profile['username']}")
+
+        # Profile Overview — counts pulled into locals once
+        fr = selected_profile.get('followers', 0) or 0
+        fg = selected_profile.get('following', 0) or 0
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Followers", f"{fr:,}")
+        col2.metric("Following", f"{fg:,}")
+        col3.metric("Posts", f"{selected_profile.get('posts_count', 0):,}")
+
+        ratio = fr / fg if fg else fr
+        col4.metric("Follower Ratio", f"{ratio:.2f}x")
+
+        # Engagement Metrics
+        st.subheader("📊 Engagement Metrics")
+        metrics = selected_profile.get('metrics', {})
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Avg ER", f"{metrics.get('er_avg', 0)}%")
+        col2.metric("Median ER", f"{metrics.get('er_median', 0)}%")
+        col3.metric("Avg Likes", f"{metrics.get('avg_likes', 0):,.0f}")
+        col4.metric("Avg Comments", f"{metrics.get('avg_comments', 0):,.0f}")
+
+        # Comment Quality
+        st.subheader("💬 Comment Quality Analysis")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Generic Comments", f"{metrics.get('generic_comments_pct', 0)}%")
+        col2.metric("Duplicate Comments", f"{metrics.get('duplicate_comments_pct', 0)}%")
+        col3.metric("Repeat Commenters", f"{metrics.get('repeat_commenters_pct', 0)}%")
+
+        # Posts Analysis
+        posts = selected_profile.get('posts', [])
+        if posts:
+            st.subheader("📸 Posts Performance")
+
+            # Create dataframe (cached per selected file)
+            posts_df = build_posts_df(profile_path, profile_mtime)
+
+            # Engagement over time
+            st.plotly_chart(make_engagement_fig(profile_path, profile_mtime), use_container_width=True)
+
+            # Post type distribution
+            col1, col2 = st.columns(2)
+
+            # Aggregates saved with the audit are preferred; older files
+            # without them fall back to computing from the posts.
+            precomputed = selected_profile.get('precomputed', {})
+
+            with col1:
+                # sort=False skips the ordering pass; pie slices don't care.
+                type_counts = precomputed.get('post_type_counts') \
+                    or posts_df['type'].value_counts(sort=False).to_dict()
+                fig_types = make_types_fig(tuple(type_counts.keys()), tuple(type_counts.values()))
+                st.plotly_chart(fig_types, use_container_width=True)
+
+            with col2:
+                # Hashtags usage
+                st.plotly_chart(make_hashtags_fig(profile_path, profile_mtime), use_container_width=True)
+
+            # Top performing posts
+            st.subheader("🏆 Top Performing Posts")
+            if precomputed.get('top_posts'):
+                top_posts = pd.DataFrame(precomputed['top_posts'])
             else:
-                return ['background-color: #ccffcc'] * len(row)
-        
-        st.dataframe(
-            sample_df[['username', 'followers', 'following', 'posts', 'likely_fake', 'is_private']].head(20),
-            use_container_width=True
-        )
+                top_posts = posts_df.nlargest(5, 'engagement')[['shortcode', 'likes', 'comments', 'engagement', 'type']]
+            # Records list: tiny frame, skips pandas metadata serialization
+            st.dataframe(top_posts.to_dict('records'), use_container_width=True)
+
+            # All hashtags frequency
+            top_tags = precomputed.get('hashtag_top15')
+            if top_tags is None:
+                # Counter beats building a pandas Series + hashtable for the
+                # few hundred tags typical here; feed the chart directly.
+                all_hashtags = list(chain.from_iterable(p.get('hashtags') or () for p in posts))
+                top_tags = Counter(all_hashtags).most_common(15)
+
+            if top_tags:
+                st.subheader("🏷️ Most Used Hashtags")
+                fig_hashtag_freq = make_hashtag_freq_fig(tuple(map(tuple, top_tags)))
+                st.plotly_chart(fig_hashtag_freq, use_container_width=True)
+
+with follower_tab:
+    if selected_follower:
+        st.header(f"👥 Follower Analysis: @{selected_follower['target_username']}")
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Sample Size", f"{selected_follower.get('sample_size_collected', 0)}")
+        col2.metric("Bot-like %", f"{selected_follower.get('likely_bot_like_pct', 0)}%")
+        col3.metric("Authentic %", f"{100 - selected_follower.get('likely_bot_like_pct', 0)}%")
+
+        # Bot reasons
+        reason_counts = selected_follower.get('reason_counts', {})
+        if reason_counts:
+            st.subheader("🚩 Bot Indicators")
+
+            fig_reasons = make_reasons_fig(tuple(reason_counts.items()))
+            st.plotly_chart(fig_reasons, use_container_width=True)
+
+        # Follower sample preview
+        followers_sample = selected_follower.get('followers_sample_preview', [])
+        if followers_sample:
+            st.subheader("👤 Sample Followers")
+
+            sample_df = pd.DataFrame(followers_sample)
+
+            # Add color coding
+            def color_fake(row):
+                if row['likely_fake']:
+                    return ['background-color: #ffcccc'] * len(row)
+                else:
+                    return ['background-color: #ccffcc'] * len(row)
+
+            st.dataframe(
+                sample_df[['username', 'followers', 'following', 'posts', 'likely_fake', 'is_private']].head(20),
+                use_container_width=True
+            )
 
 st.divider()
 
@@ -547,22 +680,29 @@ st.divider()
 st.subheader("💾 Export Data")
 col1, col2 = st.columns(2)
 
+
+# CSV bytes built once per (path, mtime) and written through a buffer in
+# chunks instead of materializing the whole table as one Python string.
+@st.cache_data
+def audit_csv(path, mtime, field):
+    df = pd.DataFrame(load_audit(path, mtime).get(field, []))
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, chunksize=10_000)
+    return buf.getvalue()
+
+
 if selected_profile and col1.button("Download Profile Data (CSV)"):
-    posts_df = pd.DataFrame(selected_profile.get('posts', []))
-    csv = posts_df.to_csv(index=False)
     st.download_button(
         "Download CSV",
-        csv,
+        audit_csv(profile_path, profile_mtime, 'posts'),
         f"profile_{selected_profile['username']}.csv",
         "text/csv"
     )
 
 if selected_follower and col2.button("Download Follower Data (CSV)"):
-    followers_df = pd.DataFrame(selected_follower.get('followers_sample_preview', []))
-    csv = followers_df.to_csv(index=False)
     st.download_button(
         "Download CSV",
-        csv,
+        audit_csv(follower_path, follower_mtime, 'followers_sample_preview'),
         f"followers_{selected_follower['target_username']}.csv",
         "text/csv"
     )